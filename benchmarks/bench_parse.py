@@ -0,0 +1,255 @@
+"""Reproducible benchmarks of the Datify parsing engine.
+
+Measures `Datify.parse` on the fixed, seeded sets of inputs: digit-only dates, general format dates, alphabetic dates in
+English, Ukrainian and Russian, inflected month names, non-date noise, and English dates and real prose in the languages
+of the shipped locale packs with the growing number of the enabled packs. The cases are run with `day_first` both
+enabled and disabled.
+
+For every case, the throughput (calls per second) and the percentiles of the per-call latency are reported. The results
+can be saved as a JSON baseline and compared with a baseline saved by a previous run:
+
+    python benchmarks/bench_parse.py --save baseline.json
+    python benchmarks/bench_parse.py --compare baseline.json
+
+The comparison exits with the status 1 if any case is slower than the baseline by more than the `--threshold`.
+The benchmarks do not need anything but the standard library and Datify itself.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+from contextlib import contextmanager
+from typing import Callable, Iterator
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from datify import Datify, DatifyConfig, locales  # noqa: E402
+
+SEED = 2022
+"""The seed of the input generators, so every run measures the same inputs."""
+
+ENGLISH = ('January', 'February', 'March', 'April', 'May', 'June', 'July', 'August', 'September', 'October',
+           'November', 'December')
+UKRAINIAN = ('січень', 'лютий', 'березень', 'квітень', 'травень', 'червень', 'липень', 'серпень', 'вересень',
+             'жовтень', 'листопад', 'грудень')
+RUSSIAN = ('январь', 'февраль', 'март', 'апрель', 'май', 'июнь', 'июль', 'август', 'сентябрь', 'октябрь', 'ноябрь',
+           'декабрь')
+INFLECTED = ('січня', 'лютого', 'березня', 'квітня', 'травня', 'червня', 'липня', 'серпня', 'вересня', 'жовтня',
+             'листопада', 'грудня', 'января', 'февраля', 'марта', 'апреля', 'мая', 'июня', 'июля', 'августа',
+             'сентября', 'октября', 'ноября', 'декабря')
+NOISE_WORDS = ('lorem', 'ipsum', 'dolor', 'sit', 'amet', 'consectetur', 'adipiscing', 'elit', 'sed', 'do', 'eiusmod',
+               'tempor', 'incididunt', 'ut', 'labore', 'et', 'dolore', 'magna', 'aliqua', 'order', '#1234', 'qty:')
+PROSE = (
+    'The mayor decided to march with the junior members of the novel octet in August weather.',
+    'Janet sent a decent memo about the marching band and the augmented budget for the new season.',
+    'Der Mais war im Märchenwald, doch die Dezimalzahlen der Oktave blieben ein Augenblick der Juniorpartner.',
+    'Die Novelle des Maiers beschreibt den Marsch durch den Dezemberschnee und die Julianische Ordnung.',
+    'El mayor de los marineros abrió la octava novela de la junta durante el agosto caluroso.',
+    'Los novios marcharon por la avenida mayor mientras el diciembre llegaba a la ciudad.',
+    'Le maire a marché avec les novices du juillet dernier vers la décision du mois.',
+    'La marmotte a avalé un avocat pendant que le janvier froid envahissait les octrois.',
+    'Il marinaio maggiore ha aperto la novella di ottobre con un giudizio decente sul giugno.',
+    'La marcia dei giovani novizi attraversava il lungomare mentre il dicembre arrivava.',
+    'Marynarz kupił lipowy miód i wrzosy, a czerwony liść spadł na grudkę ziemi w sierpniowym słońcu.',
+    'Listonosz przyniósł kwiaty, styczność z lutownicą była krótka, a maj się skończył.',
+    'Марка майки была липкой, а декабрист читал октаву об августейшей особе.',
+    'Сентиментальный январский снег падал на мартовские крыши и ноющие провода.',
+    'Листоноша приніс квіти, червоний березовий лист лежав на травах біля липи.',
+    'Лютий вітер гнав серпанок над грудками землі, а жовтий вересовий квіт хилився.',
+)
+"""The sentences of real prose in the languages of the shipped locale packs, with many words sharing the first letters
+with the month names."""
+
+PACKS = tuple(sorted(locales.available(), key=lambda code: code != 'en'))
+"""The codes of the shipped locale packs, enabled in this order by the locale growth cases, English first."""
+
+LOCALE_COUNTS = (1, 2, 4, len(PACKS))
+"""The numbers of the shipped locale packs enabled for the locale growth cases."""
+
+
+def _digit_dates(rnd: random.Random) -> str:
+    sep = rnd.choice('./- ')
+    return sep.join((str(rnd.randint(1, 28)), str(rnd.randint(1, 12)), str(rnd.randint(1950, 2022))))
+
+
+def _general_dates(rnd: random.Random) -> str:
+    return f'{rnd.randint(1950, 2022)}{rnd.randint(1, 12):02}{rnd.randint(1, 28):02}'
+
+
+def _alphabetic_dates(months: tuple[str, ...]) -> Callable[[random.Random], str]:
+    def generate(rnd: random.Random) -> str:
+        return f'{rnd.randint(1, 28)} {rnd.choice(months)} {rnd.randint(1950, 2022)}'
+
+    return generate
+
+
+def _noise(rnd: random.Random) -> str:
+    return ' '.join(rnd.choice(NOISE_WORDS) for _ in range(rnd.randint(2, 6)))
+
+
+def _prose(rnd: random.Random) -> str:
+    return rnd.choice(PROSE)
+
+
+@contextmanager
+def _config(day_first: bool, packs: int = 0) -> Iterator[None]:
+    """Applies the benchmark configuration and restores the previous one afterwards.
+
+    If `packs` is not 0, only the month names of the first `packs` shipped locale packs are searched.
+    """
+
+    snapshot = DatifyConfig.snapshot()
+
+    DatifyConfig.day_first = day_first
+    if packs:
+        DatifyConfig.use_locales(*PACKS[:packs])
+
+    try:
+        yield
+    finally:
+        DatifyConfig.load_snapshot(snapshot)
+
+
+def _cases() -> Iterator[tuple[str, Callable[[random.Random], str], int]]:
+    """Yields the (name, input generator, number of the enabled locale packs) of the benchmark cases."""
+
+    yield 'digit', _digit_dates, 0
+    yield 'general', _general_dates, 0
+    yield 'english', _alphabetic_dates(ENGLISH), 0
+    yield 'ukrainian', _alphabetic_dates(UKRAINIAN), 0
+    yield 'russian', _alphabetic_dates(RUSSIAN), 0
+    yield 'inflected', _alphabetic_dates(INFLECTED), 0
+    yield 'noise', _noise, 0
+
+    # the same inputs with more month names indexed: the English month names are found exactly, and the prose words
+    # are compared with the month names of the enabled packs that share their first letters
+    for packs in LOCALE_COUNTS:
+        yield f'locales-{packs}', _alphabetic_dates(ENGLISH), packs
+        yield f'locales-prose-{packs}', _prose, packs
+
+
+def _percentile(sorted_values: list[float], fraction: float) -> float:
+    return sorted_values[min(len(sorted_values) - 1, int(fraction * len(sorted_values)))]
+
+
+def run_case(generate: Callable[[random.Random], str], number: int, repeat: int) -> dict[str, float]:
+    """Measures `Datify.parse` on `number` generated inputs.
+
+    The throughput is the best of `repeat` runs over all the inputs. The latency percentiles are measured with the
+    separate timing of each call.
+
+    :return: the dict of the throughput (calls per second) and the latency percentiles (microseconds)
+    """
+
+    rnd = random.Random(SEED)
+    strings = [generate(rnd) for _ in range(number)]
+    parse = Datify.parse
+
+    # warm up the caches of the config
+    for string in strings[:100]:
+        parse(string)
+
+    best = float('inf')
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for string in strings:
+            parse(string)
+        best = min(best, time.perf_counter() - start)
+
+    clock = time.perf_counter_ns
+    latencies = []
+    for string in strings:
+        start = clock()
+        parse(string)
+        latencies.append((clock() - start) / 1000)
+
+    latencies.sort()
+    return {
+        'throughput': number / best,
+        'p50_us': _percentile(latencies, 0.5),
+        'p90_us': _percentile(latencies, 0.9),
+        'p99_us': _percentile(latencies, 0.99),
+    }
+
+
+def run(number: int, repeat: int, name_filter: str | None = None) -> dict[str, dict[str, float]]:
+    """Runs all the benchmark cases with `day_first` enabled and disabled and prints the results."""
+
+    results = {}
+    print(f'{"case":<34}{"calls/s":>12}{"p50 us":>10}{"p90 us":>10}{"p99 us":>10}')
+
+    for day_first in (True, False):
+        for name, generate, packs in _cases():
+            case = f'{name}[day_first={day_first}]'
+            if name_filter is not None and name_filter not in case:
+                continue
+
+            with _config(day_first, packs):
+                result = results[case] = run_case(generate, number, repeat)
+
+            print(f'{case:<34}{result["throughput"]:>12,.0f}{result["p50_us"]:>10.2f}{result["p90_us"]:>10.2f}'
+                  f'{result["p99_us"]:>10.2f}')
+
+    return results
+
+
+def compare(results: dict[str, dict[str, float]], baseline: dict[str, dict[str, float]], threshold: float) -> bool:
+    """Prints the throughput change against the baseline. Returns False if any case regressed beyond the threshold."""
+
+    ok = True
+    print(f'\n{"case":<34}{"baseline":>12}{"current":>12}{"change":>9}')
+
+    for case, result in results.items():
+        if case not in baseline:
+            continue
+
+        before, after = baseline[case]['throughput'], result['throughput']
+        change = after / before - 1
+        regressed = change < -threshold
+        ok = ok and not regressed
+
+        print(f'{case:<34}{before:>12,.0f}{after:>12,.0f}{change:>+9.1%}' + ('  REGRESSION' if regressed else ''))
+
+    return ok
+
+
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split('\n\n')[0])
+    parser.add_argument('--number', type=int, default=20_000, help='the number of the inputs of each case')
+    parser.add_argument('--repeat', type=int, default=3, help='the number of the throughput runs of each case')
+    parser.add_argument('--filter', dest='name_filter', help='run only the cases containing the substring')
+    parser.add_argument('--save', metavar='PATH', help='save the results as a JSON baseline')
+    parser.add_argument('--compare', metavar='PATH', help='compare the results with a JSON baseline')
+    parser.add_argument('--threshold', type=float, default=0.1,
+                        help='the relative throughput loss considered a regression (default: 0.1)')
+    args = parser.parse_args(argv)
+
+    results = run(args.number, args.repeat, args.name_filter)
+
+    if args.save:
+        with open(args.save, 'w', encoding='utf-8') as file:
+            json.dump({
+                'python': platform.python_version(),
+                'platform': platform.platform(),
+                'number': args.number,
+                'results': results,
+            }, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+
+        if not compare(results, baseline, args.threshold):
+            return 1
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -1 +1,2 @@
-from datify.datify import Datify, DatifyConfig
+from datify.datify import (Datify, DatifyConfig, DatifyResult, DateArrays, DateLayout, DateMatch, DateStatus, Parser,
+                           find_all, parse_stream, to_epoch_days, to_iso, to_ordinals, to_yyyymmdd, validate, validate_many)
@@ -0,0 +1,5 @@
+import sys
+
+from datify.cli import main
+
+sys.exit(main())
@@ -0,0 +1,261 @@
+"""The command-line bulk converter of the date strings to ISO-8601.
+
+Reads a file with a date string on each line, or one column of a CSV/TSV file, and writes the ISO-8601 date
+(`YYYY-MM-DD`) of each row, or an empty line if the row does not contain a complete valid date:
+
+    python -m datify dates.txt -o dates.iso.txt
+    python -m datify export.csv --column created --header --month-first --workers 8
+
+The input file is memory-mapped and split into chunks at the line boundaries. The chunks are parsed by a pool of worker
+processes with the snapshot of the DatifyConfig built from the flags, and the output is written in the order of the
+input rows.
+"""
+
+from __future__ import annotations
+
+import argparse
+import csv
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import IO, Iterator, Sequence
+
+from datify.datify import DatifyConfig, Parser, to_iso
+
+
+def _chunks(size: int, data: mmap.mmap, start: int, chunk_size: int) -> Iterator[tuple[int, int]]:
+    """Yields the (start, end) bounds of the chunks of the mapped file split at the line boundaries.
+
+    :param size: the size of the file
+    :param data: the memory-mapped file
+    :param start: the offset to start the first chunk at
+    :param chunk_size: the approximate size of a chunk
+    :return: the iterator over the chunk bounds
+    """
+
+    while start < size:
+        end = data.find(b'\n', min(start + chunk_size, size) - 1)
+        end = size if end == -1 else end + 1
+
+        yield start, end
+        start = end
+
+
+class _Converter:
+    """Converts the chunks of the mapped input file to the ISO-8601 output lines."""
+
+    def __init__(self, path: str, snapshot: dict[str, ...], column: int | None, delimiter: str, encoding: str):
+        self.path = path
+        self.parser = Parser(snapshot)
+        self.column = column
+        self.delimiter = delimiter
+        self.encoding = encoding
+
+    def convert(self, bounds: tuple[int, int]) -> str:
+        """Returns the output of the chunk with the given (start, end) bounds, a line for each row of the chunk."""
+
+        start, end = bounds
+        with open(self.path, 'rb') as file, mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            text = data[start:end].decode(self.encoding)
+
+        lines = text.split('\n')
+        if lines[-1] == '':
+            lines.pop()
+
+        lines = [line.rstrip('\r') for line in lines]
+        values = lines if self.column is None else map(self._cell, csv.reader(lines, delimiter=self.delimiter))
+
+        formatted = to_iso(map(self.parser.parse_string, values))
+        return '\n'.join(formatted) + '\n' if formatted else ''
+
+    def _cell(self, row: list[str]) -> str:
+        """Returns the value of the converted column of the row, or an empty string if the row is too short."""
+
+        return row[self.column] if self.column < len(row) else ''
+
+
+_worker_converter: _Converter | None = None
+"""The converter of a worker process, built from the arguments sent by the parent process."""
+
+
+def _init_worker(*args) -> None:
+    """Builds the converter of a worker process."""
+
+    global _worker_converter
+    _worker_converter = _Converter(*args)
+
+
+def _convert_chunk(bounds: tuple[int, int]) -> str:
+    """Converts the chunk of the input file in a worker process."""
+
+    return _worker_converter.convert(bounds)
+
+
+def _read_locale(path: str, encoding: str) -> list[list[str]]:
+    """Reads a locale file: 12 lines with the comma-separated names of each month in the month order.
+
+    :param path: the path of the locale file
+    :param encoding: the encoding of the file
+    :return: the list of the names of each month
+    """
+
+    with open(path, encoding=encoding) as file:
+        months = [[name.strip() for name in line.split(',') if name.strip()] for line in file if line.strip()]
+
+    if len(months) != 12:
+        raise ValueError('Invalid locale file {}: expected 12 lines of the month names, got {}'
+                         .format(path, len(months)))
+
+    return months
+
+
+def _configure(args: argparse.Namespace) -> None:
+    """Applies the configuration flags to the DatifyConfig."""
+
+    if args.day_first is not None:
+        DatifyConfig.day_first = args.day_first
+
+    for splitter in args.splitters:
+        DatifyConfig.splitters.add(splitter)
+
+    for path in args.locales:
+        for ordinal, names in enumerate(_read_locale(path, args.encoding), start=1):
+            for name in names:
+                DatifyConfig.add_month_name(ordinal, name)
+
+
+def _column_index(header: str, column: str, delimiter: str) -> int:
+    """Returns the index of the column with the given name or index in the CSV header."""
+
+    names = next(csv.reader([header], delimiter=delimiter), [])
+    if column in names:
+        return names.index(column)
+
+    if column.isdigit():
+        return int(column)
+
+    raise ValueError('Column {!r} is not found in the header: {}'.format(column, ', '.join(names)))
+
+
+def convert(path: str, output: IO[str], column: str | None = None, delimiter: str = ',', header: bool = False,
+            workers: int | None = None, chunk_size: int = 1 << 20, encoding: str = 'utf-8') -> None:
+    """Converts the rows of the input file to the ISO-8601 dates with the current DatifyConfig.
+
+    :param path: the path of the input file
+    :param output: the text file object to write the output lines to
+    :param column: the name or the 0-based index of the CSV column to convert, or None to convert the whole lines
+    :param delimiter: the delimiter of the CSV columns
+    :param header: whether the first line of the file is the header, which is skipped
+    :param workers: the number of the worker processes, all the CPUs are used if None
+    :param chunk_size: the approximate size of the chunks of the input sent to the workers, in bytes
+    :param encoding: the encoding of the input file
+    :return: None
+    """
+
+    if chunk_size < 1:
+        raise ValueError('Invalid chunk size {}. The chunk size must be positive'.format(chunk_size))
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    elif workers < 1:
+        raise ValueError('Invalid number of workers {}. The number of workers must be positive'.format(workers))
+
+    with open(path, 'rb') as file:
+        size = os.fstat(file.fileno()).st_size
+        if size == 0:
+            return
+
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            start = 0
+            header_line = ''
+            if header:
+                start = data.find(b'\n') + 1 or size
+                header_line = data[:start].decode(encoding).rstrip('\r\n')
+
+            column_index = None
+            if column is not None:
+                column_index = _column_index(header_line, column, delimiter) if header else int(column)
+
+            bounds = list(_chunks(size, data, start, chunk_size))
+
+    converter_args = (path, DatifyConfig.snapshot(), column_index, delimiter, encoding)
+
+    if workers <= 1 or len(bounds) <= 1:
+        converter = _Converter(*converter_args)
+        for chunk in bounds:
+            output.write(converter.convert(chunk))
+
+        return
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=converter_args) as executor:
+        for converted in executor.map(_convert_chunk, bounds):
+            output.write(converted)
+
+
+def _positive_int(value: str) -> int:
+    """Converts the argument to a positive integer, or raises ArgumentTypeError."""
+
+    try:
+        number = int(value)
+    except ValueError:
+        number = 0
+
+    if number < 1:
+        raise argparse.ArgumentTypeError('{!r} is not a positive integer'.format(value))
+
+    return number
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(prog='python -m datify', description='Converts the date strings of a file, or '
+                                     'of a CSV/TSV column, to ISO-8601 dates, one line for each row. The rows without '
+                                     'a complete valid date are written as empty lines.')
+    parser.add_argument('input', help='the path of the input file')
+    parser.add_argument('-o', '--output', help='the path of the output file, the standard output is used by default')
+    parser.add_argument('-c', '--column', help='the name or the 0-based index of the CSV column to convert')
+    parser.add_argument('-d', '--delimiter', default=',', help='the delimiter of the CSV columns (default: ",")')
+    parser.add_argument('--tsv', action='store_const', const='\t', dest='delimiter',
+                        help='use the tab as the delimiter of the columns')
+    parser.add_argument('--header', action='store_true', help='skip the first line of the file as the header')
+
+    day_first = parser.add_mutually_exclusive_group()
+    day_first.add_argument('--day-first', action='store_true', dest='day_first', default=None,
+                           help='find the day before the month (the default of DatifyConfig)')
+    day_first.add_argument('--month-first', action='store_false', dest='day_first',
+                           help='find the month before the day, e.g. 12.31.2021')
+
+    parser.add_argument('-s', '--splitter', action='append', default=[], dest='splitters',
+                        help='an extra splitter of the date parts, can be repeated')
+    parser.add_argument('-l', '--locale', action='append', default=[], dest='locales',
+                        help='the path of a locale file with 12 lines of the comma-separated names of each month, '
+                             'can be repeated')
+    parser.add_argument('-j', '--workers', type=_positive_int,
+                        help='the number of the worker processes (default: the number of CPUs)')
+    parser.add_argument('--chunk-size', type=_positive_int, default=1 << 20,
+                        help='the approximate size of the input chunks sent to the workers, in bytes')
+    parser.add_argument('--encoding', default='utf-8', help='the encoding of the input and locale files')
+
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """Runs the converter with the given command-line arguments and returns the exit status."""
+
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    try:
+        _configure(args)
+
+        if args.output is None:
+            convert(args.input, sys.stdout, args.column, args.delimiter, args.header, args.workers, args.chunk_size,
+                    args.encoding)
+        else:
+            with open(args.output, 'w', encoding='utf-8', newline='') as output:
+                convert(args.input, output, args.column, args.delimiter, args.header, args.workers, args.chunk_size,
+                        args.encoding)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f'{parser.prog}: error: {e}\n')
+
+    return 0
@@ -0,0 +1,46 @@
+"""The inflection tables of the Ukrainian and Russian month names.
+
+The tables map the nominative month names to their other case forms: genitive, dative, instrumental and locative
+(prepositional), and the alternative dative and locative forms. The accusative forms of the month names are the same as
+the nominative ones. The forms with 'ё' are also given with 'е', as they are usually written.
+
+When a month name from the tables is added to the month names index, its forms are added to the exact lookup, so the
+inflected month names like in '14 лютого 2022' or '31 декабря 2021' are found without the fuzzy comparison.
+"""
+
+from __future__ import annotations
+
+UKRAINIAN: dict[str, tuple[str, ...]] = {
+    'січень': ('січня', 'січню', 'січневі', 'січнем', 'січні'),
+    'лютий': ('лютого', 'лютому', 'лютім', 'лютим'),
+    'березень': ('березня', 'березню', 'березневі', 'березнем', 'березні'),
+    'квітень': ('квітня', 'квітню', 'квітневі', 'квітнем', 'квітні'),
+    'травень': ('травня', 'травню', 'травневі', 'травнем', 'травні'),
+    'червень': ('червня', 'червню', 'червневі', 'червнем', 'червні'),
+    'липень': ('липня', 'липню', 'липневі', 'липнем', 'липні'),
+    'серпень': ('серпня', 'серпню', 'серпневі', 'серпнем', 'серпні'),
+    'вересень': ('вересня', 'вересню', 'вересневі', 'вереснем', 'вересні'),
+    'жовтень': ('жовтня', 'жовтню', 'жовтневі', 'жовтнем', 'жовтні'),
+    'листопад': ('листопада', 'листопаду', 'листопадові', 'листопадом', 'листопаді'),
+    'грудень': ('грудня', 'грудню', 'грудневі', 'груднем', 'грудні'),
+}
+"""The genitive, dative, instrumental and locative forms of the Ukrainian month names."""
+
+RUSSIAN: dict[str, tuple[str, ...]] = {
+    'январь': ('января', 'январю', 'январём', 'январем', 'январе'),
+    'февраль': ('февраля', 'февралю', 'февралём', 'февралем', 'феврале'),
+    'март': ('марта', 'марту', 'мартом', 'марте'),
+    'апрель': ('апреля', 'апрелю', 'апрелем', 'апреле'),
+    'май': ('мая', 'маю', 'маем', 'мае'),
+    'июнь': ('июня', 'июню', 'июнем', 'июне'),
+    'июль': ('июля', 'июлю', 'июлем', 'июле'),
+    'август': ('августа', 'августу', 'августом', 'августе'),
+    'сентябрь': ('сентября', 'сентябрю', 'сентябрём', 'сентябрем', 'сентябре'),
+    'октябрь': ('октября', 'октябрю', 'октябрём', 'октябрем', 'октябре'),
+    'ноябрь': ('ноября', 'ноябрю', 'ноябрём', 'ноябрем', 'ноябре'),
+    'декабрь': ('декабря', 'декабрю', 'декабрём', 'декабрем', 'декабре'),
+}
+"""The genitive, dative, instrumental and prepositional forms of the Russian month names."""
+
+FORMS: dict[str, tuple[str, ...]] = {**UKRAINIAN, **RUSSIAN}
+"""The inflected forms of all the month names in the tables by their nominative names."""
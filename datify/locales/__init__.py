@@ -0,0 +1,91 @@
+"""The month names locale packs shipped with Datify.
+
+Each pack is a JSON file in this package named by the locale code, e.g. `uk.json`, with the full name, the
+abbreviations and the inflected forms of each month. The case forms of the Ukrainian and Russian month names are not
+repeated in the packs: they are taken from the inflection tables of `datify.inflections`. The packs are loaded on the
+first use, and the month names lookup index of each pack is built once when it is loaded, so enabling the packs does
+not rebuild the index name by name.
+
+```
+DatifyConfig.use_locales('en', 'uk')  # only the English and Ukrainian month names are searched
+DatifyConfig.add_locale('de')  # the German month names are searched as well
+
+Parser(months=locales.months('pl'))  # a parser with only the Polish month names
+```
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import pkgutil
+from typing import NamedTuple
+
+from datify import datify, inflections
+
+
+class LocalePack(NamedTuple):
+    """The loaded locale pack: the normalized names of each month and the prebuilt lookup index of the names."""
+
+    code: str
+    """The code of the locale, e.g. 'uk'."""
+
+    name: str
+    """The English name of the language of the locale, e.g. 'Ukrainian'."""
+
+    months: tuple[frozenset[str], ...]
+    """The 12 sets of the normalized full names, abbreviations and inflected forms of each month."""
+
+    index: datify._MonthIndex
+    """The month names lookup index of the pack. It must not be modified."""
+
+
+_packs: dict[str, LocalePack] = {}
+"""The loaded locale packs by their codes."""
+
+
+def available() -> list[str]:
+    """Returns the sorted codes of the locale packs shipped with Datify."""
+
+    return sorted(file[:-5] for file in os.listdir(os.path.dirname(__file__)) if file.endswith('.json'))
+
+
+def load(code: str) -> LocalePack:
+    """Returns the locale pack with the given code, loading it on the first call.
+
+    If there is no locale pack with the given code, the ValueError is raised.
+
+    :param code: the code of the locale, e.g. 'uk'
+    :return: the loaded LocalePack
+    """
+
+    pack = _packs.get(code)
+    if pack is not None:
+        return pack
+
+    if code not in available():
+        raise ValueError('Unknown locale {!r}. The available locales are: {}'.format(code, ', '.join(available())))
+
+    data = json.loads(pkgutil.get_data(__name__, f'{code}.json').decode('utf-8'))
+    if len(data['months']) != 12:
+        raise ValueError('Invalid locale pack {!r}: expected 12 months, got {}'.format(code, len(data['months'])))
+
+    months = tuple(
+        frozenset(map(datify._normalize_month_name, (month['name'], *month['abbreviations'], *month.get('forms', ()),
+                                                     *inflections.FORMS.get(month['name'], ()))))
+        for month in data['months']
+    )
+
+    pack = _packs[code] = LocalePack(code, data['name'], months, datify._MonthIndex(months))
+    return pack
+
+
+def months(*codes: str) -> tuple[frozenset[str], ...]:
+    """Returns the 12 sets of the month names of all the given locale packs, e.g. for the `Parser(months=...)`.
+
+    :param codes: the codes of the locales
+    :return: the tuple of the sets of the month names
+    """
+
+    packs = [load(code) for code in codes]
+    return tuple(frozenset().union(*(pack.months[n] for pack in packs)) for n in range(12))
@@ -0,0 +1,112 @@
+"""The optional pandas integration of Datify.
+
+The date columns usually have much fewer distinct values than rows, so the columns are factorized first: each distinct
+value is parsed only once, and the results are broadcast back to the rows with the factorization codes.
+
+```
+import datify.pandas
+
+parts = datify.pandas.parse_series(df['created'])  # the nullable Int year, month and day columns
+df['created'] = df['created'].datify.to_datetime()  # the datetime64[s] column, NaT for invalid dates
+```
+
+Importing this module registers the `.datify` accessor of the pandas Series. Requires pandas to be installed.
+"""
+
+from __future__ import annotations
+
+from datify.datify import Datify, DateArrays
+
+try:
+    import numpy as np
+    import pandas as pd
+except ImportError:  # pandas is an optional dependency used only by this module
+    np = pd = None
+
+
+def _factorize(series: pd.Series, year: int | None, month: int | None,
+               day: int | None) -> tuple[np.ndarray, DateArrays]:
+    """Parses the distinct values of the series and returns the factorization codes and the parsed values.
+
+    :return: the codes of the rows, -1 for the missing values, and the DateArrays of the distinct values
+    """
+
+    if pd is None:
+        raise ImportError('pandas is required for the pandas integration of Datify, install it with '
+                          '`pip install datify[pandas]`')
+
+    codes, uniques = pd.factorize(series)
+    return codes, Datify.parse_arrays(np.asarray(uniques, dtype=object), year, month, day)
+
+
+def _broadcast(values: np.ndarray, codes: np.ndarray, fill) -> np.ndarray:
+    """Returns the values of the distinct values for each row, the missing values (code -1) get the `fill` value."""
+
+    # the code -1 takes the appended last element
+    return np.append(values, np.array([fill], dtype=values.dtype))[codes]
+
+
+def parse_series(series: pd.Series, year: int | None = None, month: int | None = None,
+                 day: int | None = None) -> pd.DataFrame:
+    """Parses the strings of the series and returns the DataFrame of the year, month and day columns.
+
+    The columns have the nullable `Int32`, `Int16` and `Int16` types and the index of the series. The parts which were
+    not found are `<NA>`, and so are all the parts of the missing values (None and NaN). Each distinct value is parsed
+    only once. The optional parameters are force set for every value except the missing ones, like in `Datify.parse`.
+
+    :param series: the series of the strings to be parsed
+    :param year: a predefined year to be force set for every value
+    :param month: a predefined month to be force set for every value
+    :param day: a predefined day to be force set for every value
+    :return: the DataFrame with the `year`, `month` and `day` columns
+    """
+
+    codes, arrays = _factorize(series, year, month, day)
+
+    columns = {}
+    for i, (name, values) in enumerate((('year', arrays.year), ('month', arrays.month), ('day', arrays.day))):
+        missing = ~_broadcast(arrays.mask[:, i], codes, False)
+        columns[name] = pd.arrays.IntegerArray(_broadcast(values, codes, 0), missing)
+
+    return pd.DataFrame(columns, index=series.index)
+
+
+def to_datetime(series: pd.Series, year: int | None = None, month: int | None = None,
+                day: int | None = None) -> pd.Series:
+    """Parses the strings of the series and returns the series of the dates as `datetime64[s]`.
+
+    The incomplete dates, the dates that do not exist in the calendar and the missing values are NaT. The seconds
+    resolution covers all the years the dates are parsed with, unlike `datetime64[ns]`, which is limited to the years
+    1677-2262. Each distinct value is parsed only once. The optional parameters are force set for every value, like
+    in `Datify.parse`.
+
+    :param series: the series of the strings to be parsed
+    :param year: a predefined year to be force set for every value
+    :param month: a predefined month to be force set for every value
+    :param day: a predefined day to be force set for every value
+    :return: the `datetime64[s]` series with the index and the name of the given series
+    """
+
+    codes, arrays = _factorize(series, year, month, day)
+    dates = _broadcast(arrays.datetime64(), codes, np.datetime64('NaT'))
+
+    return pd.Series(dates.astype('datetime64[s]'), index=series.index, name=series.name)
+
+
+if pd is not None:
+    @pd.api.extensions.register_series_accessor('datify')
+    class DatifyAccessor:
+        """The `.datify` accessor of the pandas Series: `series.datify.parse()` and `series.datify.to_datetime()`."""
+
+        def __init__(self, series: pd.Series):
+            self._series = series
+
+        def parse(self, year: int | None = None, month: int | None = None, day: int | None = None) -> pd.DataFrame:
+            """The same as `parse_series(series, year, month, day)`."""
+
+            return parse_series(self._series, year, month, day)
+
+        def to_datetime(self, year: int | None = None, month: int | None = None, day: int | None = None) -> pd.Series:
+            """The same as `to_datetime(series, year, month, day)`."""
+
+            return to_datetime(self._series, year, month, day)
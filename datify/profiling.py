@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import threading
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+STAGES = ('parse', 'numeric', 'general_format', 'split', 'parts', 'month_exact', 'month_fuzzy')
+"""The profiled stages of the parsing.
+
+* `parse` - the whole parsing of a string (without the results cache);
+* `numeric` - the numeric dates fast path;
+* `general_format` - the search of the general date format;
+* `split` - the split of the string into words with the separators;
+* `parts` - the assignment of the words to the date parts, including the month lookups;
+* `month_exact` - the exact month name lookups;
+* `month_fuzzy` - the fuzzy comparison of the month name forms, when the exact lookup fails.
+"""
+
+
+class Profile:
+    """The call counts and the cumulative time of the parsing stages, and the fuzzy month lookup hits and misses.
+
+    The counters are updated under a lock, so the profile can be shared by the parsing threads.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.calls: dict[str, int] = dict.fromkeys(STAGES, 0)
+        self.time: dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.fuzzy_hits = 0
+        self.fuzzy_misses = 0
+
+    def record(self, stage: str, start: float) -> None:
+        """Records a call of the stage that started at the given `time.perf_counter()` value.
+
+        :param stage: the name of the stage, one of the `STAGES`
+        :param start: the `time.perf_counter()` value at the start of the call
+        """
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.calls[stage] += 1
+            self.time[stage] += elapsed
+
+    def record_fuzzy(self, hit: bool) -> None:
+        """Counts the result of a fuzzy month lookup."""
+
+        with self._lock:
+            if hit:
+                self.fuzzy_hits += 1
+            else:
+                self.fuzzy_misses += 1
+
+    def reset(self) -> None:
+        """Resets all the counters to zero."""
+
+        with self._lock:
+            self.calls = dict.fromkeys(STAGES, 0)
+            self.time = dict.fromkeys(STAGES, 0.0)
+            self.fuzzy_hits = 0
+            self.fuzzy_misses = 0
+
+    def snapshot(self) -> dict[str, ...]:
+        """Returns the copy of the counters as a dict.
+
+        The dict has the `{'calls': int, 'time': float}` entry for each of the `STAGES`, with the time in seconds, and
+        the `fuzzy_hits` and `fuzzy_misses` counts.
+        """
+
+        with self._lock:
+            stats: dict[str, ...] = {stage: {'calls': self.calls[stage], 'time': self.time[stage]} for stage in STAGES}
+            stats['fuzzy_hits'] = self.fuzzy_hits
+            stats['fuzzy_misses'] = self.fuzzy_misses
+
+        return stats
+
+    def __repr__(self) -> str:
+        return f'<Profile[parse calls={self.calls["parse"]}, fuzzy hits={self.fuzzy_hits}, ' \
+               f'misses={self.fuzzy_misses}]>'
+
+
+_profile: Profile | None = None
+"""The active profile, or None if the profiling is disabled. The parsing checks only this variable when disabled."""
+
+
+def enable(profile: Profile | None = None) -> Profile:
+    """Enables the profiling of the parsing stages and returns the active profile.
+
+    :param profile: the profile to record the stages to, a new profile is created if None
+    :return: the active profile
+    """
+
+    global _profile
+    _profile = profile if profile is not None else Profile()
+
+    return _profile
+
+
+def disable() -> Profile | None:
+    """Disables the profiling and returns the profile that was active, if any."""
+
+    global _profile
+    profile, _profile = _profile, None
+
+    return profile
+
+
+def active() -> Profile | None:
+    """Returns the active profile, or None if the profiling is disabled."""
+
+    return _profile
+
+
+def snapshot() -> dict[str, ...] | None:
+    """Returns the counters of the active profile as a dict, or None if the profiling is disabled."""
+
+    profile = _profile
+    return profile.snapshot() if profile is not None else None
+
+
+@contextmanager
+def profile() -> Iterator[Profile]:
+    """Profiles the parsing stages inside the `with` block and restores the previously active profile afterwards.
+
+    ```
+    with profiling.profile() as stats:
+        Datify.parse_many(strings)
+
+    print(stats.snapshot())
+    ```
+    """
+
+    global _profile
+    previous = _profile
+    current = _profile = Profile()
+
+    try:
+        yield current
+    finally:
+        _profile = previous
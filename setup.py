@@ -6,6 +6,7 @@ with open("README.md", "r", encoding="utf-8") as fh:
 setuptools.setup(
     name='datify',
     packages=setuptools.find_packages(),
+    package_data={'datify.locales': ['*.json']},
     version='1.1.0',
     license='Apache-2.0',
     description='An extensible library that provides the functionality of the parsing strings in different formats to '
@@ -19,6 +20,10 @@ setuptools.setup(
     keywords=['str', 'string', 'user-experience', 'user-input', 'date', 'date-strings', 'datify', 'alpha-month',
               'month', 'english', 'russian', 'ukrainian', 'natural-language', 'open-source'],
     install_requires=[],
+    extras_require={
+        'numpy': ['numpy'],
+        'pandas': ['pandas>=2.0'],
+    },
     classifiers=[
         'Development Status :: 5 - Production/Stable',
         'Intended Audience :: Developers',
@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import io
+import os
+import tempfile
+import unittest
+
+from datify import Datify, DatifyConfig
+from datify.cli import convert, main
+
+
+class ConvertTestCase(unittest.TestCase):
+    lines = ['31.12.2021', '14 лютого 2022', '', 'not a date', '31.02.2022', '2020-01-20', '10 of Jan']
+
+    def setUp(self):
+        self.snapshot = DatifyConfig.snapshot()
+        self.directory = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        DatifyConfig.load_snapshot(self.snapshot)
+        self.directory.cleanup()
+
+    def write(self, name: str, text: str) -> str:
+        path = os.path.join(self.directory.name, name)
+        with open(path, 'w', encoding='utf-8', newline='') as file:
+            file.write(text)
+
+        return path
+
+    def expected(self) -> str:
+        return '2021-12-31\n2022-02-14\n\n\n\n2020-01-20\n\n'
+
+    def test_lines(self):
+        path = self.write('dates.txt', '\r\n'.join(self.lines))
+
+        for workers in (1, 2):
+            output = io.StringIO()
+            convert(path, output, workers=workers, chunk_size=16)
+            self.assertEqual(self.expected(), output.getvalue())
+
+    def test_csv_column(self):
+        rows = [f'{n},"{line}",x' for n, line in enumerate(self.lines)]
+        path = self.write('dates.csv', '\n'.join(['id,created,other'] + rows) + '\n')
+
+        output = io.StringIO()
+        convert(path, output, column='created', header=True, workers=2, chunk_size=32)
+        self.assertEqual(self.expected(), output.getvalue())
+
+        output = io.StringIO()
+        convert(path, output, column='1', workers=1)
+        self.assertEqual('\n' + self.expected(), output.getvalue())
+
+        path = self.write('dates.tsv', '\n'.join(f'{line}\t{n}' for n, line in enumerate(self.lines)))
+        output = io.StringIO()
+        convert(path, output, column='0', delimiter='\t', workers=1)
+        self.assertEqual(self.expected(), output.getvalue())
+
+    def test_flags(self):
+        path = self.write('dates.txt', '12.31.2021\n5 marzo 2020\n1#2#2022\n')
+        locale = self.write('es.txt', '\n'.join(['enero', 'febrero', 'marzo, mar', 'abril', 'mayo', 'junio', 'julio',
+                                                  'agosto', 'septiembre', 'octubre', 'noviembre', 'diciembre']))
+        output_path = os.path.join(self.directory.name, 'out.txt')
+
+        self.assertEqual(0, main([path, '-o', output_path, '--month-first', '-l', locale, '-s', '#', '-j', '2']))
+        with open(output_path, encoding='utf-8') as file:
+            self.assertEqual('2021-12-31\n2020-03-05\n2022-01-02\n', file.read())
+
+        # the config of the converter is set up by the flags
+        self.assertEqual(3, Datify.parse('5 marzo 2020').month)
+
+    def test_errors(self):
+        with self.assertRaises(SystemExit) as e:
+            main([os.path.join(self.directory.name, 'missing.txt')])
+
+        self.assertEqual(1, e.exception.code)
+
+        path = self.write('dates.csv', 'id,created\n1,31.12.2021\n')
+        self.assertRaises(ValueError, lambda: convert(path, io.StringIO(), column='updated', header=True))
+
+    def test_invalid_sizes(self):
+        path = self.write('dates.csv', 'id,created\n1,31.12.2021\n')
+
+        for chunk_size in (0, -1):
+            self.assertRaises(ValueError, convert, path, io.StringIO(), header=True, chunk_size=chunk_size)
+
+        self.assertRaises(ValueError, convert, path, io.StringIO(), workers=0)
+
+        for flags in (['--chunk-size', '0'], ['--workers', '0'], ['-j', '-2']):
+            with self.assertRaises(SystemExit) as e:
+                main([path, '--header', *flags])
+
+            self.assertEqual(2, e.exception.code)
+
+
+if __name__ == '__main__':
+    unittest.main()
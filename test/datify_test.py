@@ -1,11 +1,21 @@
 from __future__ import annotations
 
+import io
 import unittest
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from random import choice, randint
+from unittest import mock
 
-from datify import Datify, DatifyConfig
+from datify import (Datify, DatifyConfig, DatifyResult, DateLayout, DateStatus, Parser, find_all, inflections, locales,
+                    parse_stream, profiling, to_epoch_days, to_iso, to_ordinals, to_yyyymmdd, validate, validate_many)
 from datify.datify import _normalize_month_name
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
 
 class DigitDatesTestCase(unittest.TestCase):
     strings = [
@@ -233,6 +243,739 @@ class LocalizationTests(unittest.TestCase):
         self._cleanup()
 
 
+class LocalePacksTestCase(unittest.TestCase):
+    def setUp(self):
+        self.snapshot = DatifyConfig.snapshot()
+
+    def tearDown(self):
+        DatifyConfig.load_snapshot(self.snapshot)
+
+    def test_packs(self):
+        self.assertTrue({'en', 'uk', 'ru', 'de', 'fr', 'es', 'pl'}.issubset(locales.available()))
+
+        pack = locales.load('uk')
+        self.assertIs(pack, locales.load('uk'))
+        self.assertEqual(12, len(pack.months))
+        self.assertTrue({'лютий', 'лют', 'лютого'}.issubset(pack.months[1]))
+        self.assertEqual(2, pack.index.find('лютого'))
+
+        # the default month names are covered by the packs
+        for default, packed in zip(self.snapshot['months'], locales.months('en', 'uk', 'ru')):
+            self.assertTrue(default.issubset(packed))
+
+        self.assertRaises(ValueError, lambda: locales.load('xx'))
+
+    def test_use_locales(self):
+        DatifyConfig.use_locales('en', 'de')
+
+        self.assertEqual((5, 3, 2020), Datify.parse('5 März 2020').tuple())
+        self.assertEqual((14, None, 2022), Datify.parse('14 лютого 2022').tuple())
+        self.assertEqual(1, DatifyConfig.month_index().find('jänner'))
+
+        # the index of the pack is not modified by the config
+        DatifyConfig.add_locale('pl')
+        self.assertEqual((5, 10, 2020), Datify.parse('5 października 2020').tuple())
+        self.assertIsNone(locales.load('de').index.find('października'))
+
+        self.assertRaises(ValueError, lambda: DatifyConfig.use_locales('en', 'xx'))
+
+    def test_parser_months(self):
+        parser = Parser(months=locales.months('fr'))
+
+        self.assertEqual((2020, 8, 1), parser.parse('1 août 2020'))
+        self.assertEqual((2020, None, 1), parser.parse('1 August 2020'))
+
+
+class ConfigCacheTestCase(unittest.TestCase):
+    def test_patterns_are_reused(self):
+        self.assertIs(DatifyConfig.separators_regex(), DatifyConfig.separators_regex())
+        self.assertIs(DatifyConfig.date_format_regex(), DatifyConfig.date_format_regex())
+
+    def test_splitters_change_invalidates_cache(self):
+        version = DatifyConfig.version()
+        pattern = DatifyConfig.separators_regex()
+
+        DatifyConfig.splitters.add('#')
+        try:
+            self.assertGreater(DatifyConfig.version(), version)
+            self.assertIsNot(pattern, DatifyConfig.separators_regex())
+            self.assertEqual((10, 7, 2006), Datify.parse('10#7#2006').tuple())
+        finally:
+            DatifyConfig.splitters.remove('#')
+
+        self.assertNotIn('#', DatifyConfig.separators_regex().pattern)
+
+    def test_fields_assignment_invalidates_cache(self):
+        version = DatifyConfig.version()
+
+        DatifyConfig.day_first = False
+        DatifyConfig.day_first = True
+        self.assertEqual(version + 2, DatifyConfig.version())
+
+        splitters = DatifyConfig.splitters
+        DatifyConfig.splitters = set(splitters)
+        try:
+            # the assigned set is tracked as well
+            version = DatifyConfig.version()
+            DatifyConfig.splitters.add('#')
+            self.assertGreater(DatifyConfig.version(), version)
+        finally:
+            DatifyConfig.splitters = splitters
+
+    def test_months_change_invalidates_cache(self):
+        version = DatifyConfig.version()
+
+        DatifyConfig.months[0].add('janvier')
+        DatifyConfig.months[0].remove('janvier')
+        self.assertEqual(version + 2, DatifyConfig.version())
+
+
+class MonthIndexTestCase(unittest.TestCase):
+    def test_month_name_addition(self):
+        DatifyConfig.add_month_name(9, 'Septembre')
+        try:
+            self.assertIn('septembre', DatifyConfig.months[8])
+            self.assertEqual(9, Datify.parse('20 Septembre 2022').month)
+        finally:
+            DatifyConfig.months[8].remove('septembre')
+
+        self.assertRaises(ValueError, lambda: DatifyConfig.add_month_name(13, 'Undecimber'))
+
+    def test_index_is_updated_incrementally(self):
+        french_months = LocalizationTests.french_months
+        index = DatifyConfig.month_index()
+        months = DatifyConfig.months
+        DatifyConfig.add_months_locale(french_months)
+
+        # the names are added to the copies of the index and the month sets, the published ones are not modified
+        self.assertIsNot(index, DatifyConfig.month_index())
+        self.assertIsNone(index.find('août'))
+        self.assertNotIn('août', months[7])
+        self.assertIn('août', DatifyConfig.months[7])
+
+        index = DatifyConfig.month_index()
+        self.assertEqual(8, index.find('août'))
+
+        # the in-place modification of the month sets rebuilds the index
+        for i in range(len(french_months)):
+            DatifyConfig.months[i].remove(_normalize_month_name(french_months[i]))
+
+        self.assertIsNot(index, DatifyConfig.month_index())
+        self.assertIsNone(DatifyConfig.month_index().find('août'))
+
+    def test_month_forms_lookup(self):
+        index = DatifyConfig.month_index()
+
+        # the inflected forms from the inflection tables are found exactly
+        self.assertEqual(2, index.exact.get('лютого'))
+        self.assertEqual(5, index.exact.get('мая'))
+        self.assertEqual(12, index.exact.get('декабря'))
+        self.assertEqual(11, index.exact.get('листопаді'))
+
+        self.assertEqual(2, index.find('лютого'))
+        self.assertEqual(12, index.find('декабря'))
+        self.assertIsNone(index.find('of'))
+        self.assertIsNone(index.find('2022'))
+        self.assertIsNone(index.find(''))
+
+
+class InflectionsTestCase(unittest.TestCase):
+    def test_tables(self):
+        ordinals = {}
+        for language in (inflections.UKRAINIAN, inflections.RUSSIAN):
+            self.assertEqual(12, len(language))
+
+            for ordinal, (name, forms) in enumerate(language.items(), start=1):
+                self.assertIn(name, DatifyConfig.months[ordinal - 1])
+
+                # the forms do not collide with the forms of the other months
+                for form in forms:
+                    self.assertEqual(ordinal, ordinals.setdefault(form, ordinal))
+
+    def test_packs_have_the_forms(self):
+        for code, language in (('uk', inflections.UKRAINIAN), ('ru', inflections.RUSSIAN)):
+            for month, (name, forms) in zip(locales.load(code).months, language.items()):
+                self.assertTrue({name, *forms}.issubset(month))
+
+    def test_exact_lookup_without_fuzzy_comparison(self):
+        parser = Parser(fuzzy_months=False)
+
+        self.assertEqual((2022, 2, 14), parser.parse('14 лютого 2022'))
+        self.assertEqual((2019, 5, 10), parser.parse('10 мая 2019'))
+        self.assertEqual((2021, 12, 31), parser.parse('31 декабря 2021'))
+        self.assertEqual((2022, 11, 1), parser.parse('1 листопаді 2022'))
+
+        # the other forms are only found with the fuzzy comparison
+        self.assertEqual((2022, None, 20), parser.parse('20 septembre 2022'))
+        self.assertEqual((2022, 9, 20), Parser().parse('20 septembre 2022'))
+
+        DatifyConfig.fuzzy_months = False
+        try:
+            self.assertEqual((20, None, 2022), Datify.parse('20 septembre 2022').tuple())
+            self.assertIs(False, DatifyConfig.snapshot()['fuzzy_months'])
+        finally:
+            DatifyConfig.fuzzy_months = True
+
+
+class ParseManyTestCase(unittest.TestCase):
+    def test_results_are_in_input_order(self):
+        dates = [_random_date(i % 2 == 0)[0] for i in range(1000)] + ['not a date', '', '10 of Jan']
+
+        self.assertEqual([Datify.parse(date).tuple() for date in dates],
+                         [d.tuple() for d in Datify.parse_many(dates)])
+
+    def test_predefined_parts(self):
+        results = Datify.parse_many(iter(PredefiningDatesTestCase.dates), year=2000, day=1)
+
+        self.assertEqual([(1, 1, 2000), (1, 1, 2000), (1, 6, 2000)], [d.tuple() for d in results])
+
+    def test_day_first(self):
+        DatifyConfig.day_first = False
+        try:
+            self.assertEqual([(31, 12, 2021), (1, 7, 2020)],
+                             [d.tuple() for d in Datify.parse_many(['12.31.2021', '1 of July 2020'])])
+        finally:
+            DatifyConfig.day_first = True
+
+    def test_intern(self):
+        dates = ['31.12.2021', '2021-12-31', '31 December 2021', '10 of Jan', '10 Jan', 'text'] * 100
+        results = Datify.parse_many(dates, intern=True)
+
+        self.assertEqual(Datify.parse_many(dates), results)
+        self.assertEqual(3, len(set(map(id, results))))
+        self.assertIs(results[0], results[2])
+        self.assertEqual(3, len(set(map(id, Datify.parse_many(dates, year=2000, intern=True)))))
+
+    def test_intern_limit(self):
+        dates = [f'{day}.{month}.2021' for month in range(1, 13) for day in range(1, 29)] * 2
+
+        with mock.patch('datify.datify._INTERN_LIMIT', 100):
+            results = Datify.parse_many(dates, intern=True)
+
+        self.assertEqual(Datify.parse_many(dates), results)
+        self.assertIs(results[0], results[len(results) // 2])
+        self.assertIsNot(results[100], results[100 + len(results) // 2])
+
+    def test_invalid_chunk_size(self):
+        for chunk_size in (0, -1):
+            self.assertRaises(ValueError, Datify.parse_many, ['1.1.2020'] * 3, workers=2, chunk_size=chunk_size)
+            self.assertRaises(ValueError, Datify.parse_many, ['1.1.2020'] * 3, threads=2, chunk_size=chunk_size)
+
+    def test_workers(self):
+        dates = [_random_date(i % 2 == 0)[0] for i in range(1000)] + ['20#09#2022', '2 Avril 2008']
+        snapshot = DatifyConfig.snapshot()
+
+        DatifyConfig.splitters.add('#')
+        DatifyConfig.add_months_locale(LocalizationTests.french_months)
+        try:
+            expected = [d.tuple() for d in Datify.parse_many(dates)]
+            self.assertEqual(expected, [d.tuple() for d in Datify.parse_many(dates, workers=2, chunk_size=100)])
+        finally:
+            DatifyConfig.load_snapshot(snapshot)
+
+        self.assertEqual(snapshot, DatifyConfig.snapshot())
+
+
+class LayoutInferenceTestCase(unittest.TestCase):
+    # the rows which do not fit the dominant layout are parsed with the general parsing
+    strings = ['14 лютого 2022', '1 січня 2021', '31 декабря 2021', 'May 5 2020', '2022 лютого 5', '1 2 3 4',
+               'some text', '14 лютого-2022', '20220101 лютого 1', '5 мая 2022', '31.12.2021', '11th of July 2020',
+               '2022-02-23 10:00', '', '10 of Jan']
+
+    def test_infer_layout(self):
+        parser = Parser()
+
+        self.assertEqual(DateLayout(' ', 3, True), parser.infer_layout(self.strings[:4]))
+        self.assertEqual(DateLayout('/', 3, False), parser.infer_layout(['31/12/2021', '1/2/2022', 'text']))
+        self.assertIsNone(parser.infer_layout(['31/12/2021', '1.2.2022', '14 лютого 2022']))
+        self.assertIsNone(parser.infer_layout([]))
+        self.assertIsNone(Parser(year_format=r'\b\d\d\d\d\b').infer_layout(self.strings[:4]))
+
+    def test_results_are_the_same(self):
+        for day_first in (True, False):
+            parser = Parser(day_first=day_first)
+            strings = self.strings * 3
+
+            self.assertEqual(parser.parse_many(strings), parser.parse_many(strings, infer=4))
+
+            parse = parser.layout_parser(DateLayout(' ', 3, True))
+            self.assertEqual(list(map(parser.parse_string, strings)), list(map(parse, strings)))
+
+            # the general format dates behind the punctuation which is not a splitter
+            for separator in (' ', '-', '.', '/'):
+                general = [separator.join(words) for words in (('(20200101)', 'may', '5'), ('x2020-01-01', 'may', '5'),
+                                                                ('5', 'may', '[2020.01.01]'), ('14', 'лютого', '2022'))]
+                parse = parser.layout_parser(DateLayout(separator, 3, True))
+
+                self.assertEqual(list(map(parser.parse_string, general)), list(map(parse, general)), msg=separator)
+                self.assertEqual(parser.parse_many(general), parser.parse_many(general * 50, infer=100)[:4])
+
+        self.assertEqual(Datify.parse_many(self.strings, year=2000),
+                         Datify.parse_many(self.strings, year=2000, infer=4))
+
+    def test_workers(self):
+        self.assertEqual(Datify.parse_many(self.strings),
+                         Datify.parse_many(self.strings, workers=2, chunk_size=5, infer=3))
+
+
+@unittest.skipIf(np is None, 'NumPy is not installed')
+class ParseArraysTestCase(unittest.TestCase):
+    dates = ['31.12.2021', '10 of Jan', 'липень 2022', '31.02.2022', 'some text', None]
+
+    def test_arrays(self):
+        arrays = Datify.parse_arrays(np.array(self.dates, dtype=object))
+
+        self.assertEqual([2021, 0, 2022, 2022, 0, 0], arrays.year.tolist())
+        self.assertEqual([12, 1, 7, 2, 0, 0], arrays.month.tolist())
+        self.assertEqual([31, 10, 0, 31, 0, 0], arrays.day.tolist())
+        self.assertEqual((len(self.dates), 3), arrays.mask.shape)
+        self.assertEqual([True, False, False, True, False, False], arrays.complete.tolist())
+
+        for date, row in zip(self.dates, arrays.mask.tolist()):
+            if date is not None:
+                self.assertEqual([part is not None for part in reversed(Datify.parse(date).tuple())], row)
+
+    def test_datetime64(self):
+        dates = Datify.parse_arrays(self.dates).datetime64()
+
+        self.assertEqual(np.datetime64('2021-12-31'), dates[0])
+        self.assertTrue(np.isnat(dates[1:]).all())
+
+    def test_predefined_parts(self):
+        arrays = Datify.parse_arrays(['10 of Jan'], year=2020)
+
+        self.assertEqual(np.datetime64('2020-01-10'), arrays.datetime64()[0])
+
+    def test_iterables(self):
+        expected = Datify.parse_arrays(self.dates)
+
+        for strings in (iter(self.dates), tuple(self.dates), []):
+            arrays = Datify.parse_arrays(strings)
+
+            self.assertEqual(['int32', 'int16', 'int16', 'bool'], [str(array.dtype) for array in arrays])
+            for array, expected_array in zip(arrays, expected):
+                self.assertEqual(expected_array[:len(arrays.year)].tolist(), array.tolist())
+
+
+class ThreadSafetyTestCase(unittest.TestCase):
+    def setUp(self):
+        self.snapshot = DatifyConfig.snapshot()
+
+    def tearDown(self):
+        DatifyConfig.load_snapshot(self.snapshot)
+
+    def test_threads(self):
+        dates = [_random_date(i % 2 == 0)[0] for i in range(1000)] + ['10 of Jan', 'text']
+
+        self.assertEqual(Datify.parse_many(dates), Datify.parse_many(dates, threads=4, chunk_size=50))
+        self.assertEqual(Datify.parse_many(dates, infer=10),
+                         Datify.parse_many(dates, threads=4, chunk_size=50, infer=10, intern=True))
+        self.assertRaises(ValueError, Datify.parse_many, dates, workers=2, threads=2)
+
+    def test_config_changes_while_parsing(self):
+        dates = ['2 Avril 2008', '31.12.2021', '14 лютого 2022'] * 200
+        expected = {(2008, 4, 2), (2008, None, 2), (2021, 12, 31), (2022, 2, 14)}
+
+        def reload_locales() -> None:
+            for _ in range(50):
+                DatifyConfig.add_months_locale(LocalizationTests.french_months)
+                DatifyConfig.use_locales('en', 'uk')
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            writer = executor.submit(reload_locales)
+            readers = [executor.submit(lambda: [Datify.parse(date).tuple()[::-1] for date in dates]) for _ in range(3)]
+
+            writer.result()
+            for reader in readers:
+                self.assertLessEqual(set(reader.result()), expected)
+
+    def test_parser_is_a_snapshot(self):
+        parser = DatifyConfig.parser()
+        index = parser.month_index
+        DatifyConfig.add_months_locale(LocalizationTests.french_months)
+
+        self.assertIsNone(index.exact.get('avril'))
+        self.assertIsNone(parser.parse('2 Avril 2008').month)
+        self.assertEqual(4, DatifyConfig.parser().parse('2 Avril 2008').month)
+
+
+class ParserTestCase(unittest.TestCase):
+    def test_profiles(self):
+        eu_parser = Parser(day_first=True)
+        us_parser = Parser(day_first=False)
+
+        self.assertEqual((2, 1, 2022), eu_parser.parse('2.1.2022').tuple())
+        self.assertEqual((1, 2, 2022), us_parser.parse('2.1.2022').tuple())
+        self.assertEqual([(31, 12, 2021), (1, 7, 2020)],
+                         [d.tuple() for d in us_parser.parse_many(['12.31.2021', '1 of July 2020'])])
+
+        # the global config is not affected
+        self.assertTrue(DatifyConfig.day_first)
+        self.assertEqual((2, 1, 2022), Datify.parse('2.1.2022').tuple())
+
+    def test_concurrent_profiles(self):
+        dates = [_random_date()[0] for _ in range(1000)]
+        eu_parser = Parser(day_first=True)
+        us_parser = Parser(day_first=False)
+        expected_eu = [d.tuple() for d in eu_parser.parse_many(dates)]
+        expected_us = [d.tuple() for d in us_parser.parse_many(dates)]
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            futures = [(executor.submit(parser.parse_many, dates), expected)
+                       for parser, expected in ((eu_parser, expected_eu), (us_parser, expected_us)) * 4]
+
+            for future, expected in futures:
+                self.assertEqual(expected, [d.tuple() for d in future.result()])
+
+    def test_parser_is_immutable(self):
+        parser = Parser()
+
+        with self.assertRaises(AttributeError):
+            parser.day_first = False
+
+        with self.assertRaises(TypeError):
+            parser.snapshot['day_first'] = False
+
+        # the parser does not see the changes of the config made after its creation
+        DatifyConfig.splitters.add('#')
+        try:
+            self.assertEqual((10, None, 2006), parser.parse('10#7#2006').tuple())
+        finally:
+            DatifyConfig.splitters.remove('#')
+
+    def test_custom_fields(self):
+        parser = Parser(splitters={'_'}, months=[{name.upper()} for name in LocalizationTests.french_months])
+
+        self.assertEqual((20, 9, 2022), parser.parse('20_Septembre_2022').tuple())
+        self.assertIsNone(parser.parse('20 September 2022').month)
+        self.assertRaises(TypeError, lambda: Parser(day_first_=True))
+
+    def test_config_patterns_are_used(self):
+        day_format = DatifyConfig.day_format
+        DatifyConfig.day_format = r'\b(0?[1-9]|[12]\d|3[01])\b'
+        try:
+            self.assertEqual((5, 3, 2020), Datify.parse('05.03.2020').tuple())
+        finally:
+            DatifyConfig.day_format = day_format
+
+    def test_default_parser(self):
+        parser = DatifyConfig.parser()
+        self.assertIs(parser, DatifyConfig.parser())
+
+        DatifyConfig.day_first = True
+        self.assertIsNot(parser, DatifyConfig.parser())
+
+
+class TokenizerTestCase(unittest.TestCase):
+    strings = [
+        '05.03.2020', '00.01.2020', '2020-1-5', '5,2020', '11th of July 2020', 'July 11, 2020', '13.13.2020',
+        '01st of may 2018', '123rd of may', '2021th', '١٢.٠٥.٢٠٢٠', '31 декабря, 2021', 'the 3rd of Jan 1999',
+        'Signed on the 22nd of June 2004 by the parties', '(12) 10 2004', '12a3 5 1999', '', '.', '  ',
+    ]
+
+    def test_classification_matches_formats(self):
+        # the equivalent formats that are not the default ones make the parser match every token with the formats
+        regex_parser_kwargs = dict(day_format=DatifyConfig.day_format + '(?:)',
+                                   month_format_digit=DatifyConfig.month_format_digit + '(?:)',
+                                   year_format=DatifyConfig.year_format + '(?:)')
+        strings = self.strings + [_random_date(i % 2 == 0)[0] for i in range(1000)]
+
+        for day_first in (True, False):
+            parser = Parser(day_first=day_first)
+            regex_parser = Parser(day_first=day_first, **regex_parser_kwargs)
+            self.assertFalse(regex_parser.default_formats)
+
+            for string in strings:
+                self.assertEqual(regex_parser.parse_string(string), parser.parse_string(string), msg=string)
+
+
+class NumericFastPathTestCase(unittest.TestCase):
+    def test_fast_path_matches_general_parsing(self):
+        strings = ['20190301', '2020-01-20', '2001.12.21', '2020-13-01', '20201350', '2020/1/5', '3020-01-01',
+                   '05.03.2020', '5.3.2020', '00.01.2020', '31 12 2021', '12-31-2021', '1.1.0999', '1.123.2020']
+        for _ in range(2000):
+            year, month, day = randint(900, 3100), randint(0, 14), randint(0, 35)
+            sep = _choose_from_set(DatifyConfig.splitters)
+            strings.append(f'{year}{month:02}{day:02}')
+            strings.append(sep.join((f'{year:04}', f'{month:02}', f'{day:02}')))
+            strings.append(sep.join((str(day), str(month), str(year))))
+            strings.append(sep.join((f'{day:02}', f'{month:02}', str(year))))
+
+        for day_first in (True, False):
+            parser = Parser(day_first=day_first)
+            # the general parsing is used with the formats that are not the default ones
+            general_parser = Parser(day_first=day_first, year_format=DatifyConfig.year_format + '(?:)')
+            self.assertIsNotNone(parser.numeric_separators)
+            self.assertIsNone(general_parser.numeric_separators)
+
+            for string in strings:
+                self.assertEqual(general_parser.parse_string(string), parser.parse_string(string), msg=string)
+
+    def test_fast_path_is_disabled_for_conflicting_config(self):
+        self.assertIsNone(Parser(splitters={'.', '1'}).numeric_separators)
+        self.assertIsNone(Parser(months=[{'.'}] + [set() for _ in range(11)]).numeric_separators)
+        self.assertIsNone(Parser(months=[{'m1'}] + [set() for _ in range(11)]).numeric_separators)
+
+
+class DatifyResultTestCase(unittest.TestCase):
+    def test_result(self):
+        result = Parser().parse('31.12.2021')
+
+        self.assertIsInstance(result, DatifyResult)
+        self.assertEqual((2021, 12, 31), result)
+        self.assertEqual((31, 12, 2021), result.tuple())
+        self.assertTrue(result.complete)
+        self.assertEqual(datetime(2021, 12, 31), result.date())
+        self.assertEqual(hash(DatifyResult(2021, 12, 31)), hash(result))
+
+        with self.assertRaises(AttributeError):
+            result.year = 2022
+
+    def test_incomplete_result(self):
+        result = Parser().parse('10 of Jan')
+
+        self.assertFalse(result.complete)
+        self.assertIsNone(result.date())
+        self.assertEqual(DatifyResult(2020, 1, 10), Parser().parse('10 of Jan', year=2020))
+
+    def test_legacy_variables_are_not_set_up(self):
+        with mock.patch.object(Datify, 'setup_variables') as setup_variables:
+            self.assertIsInstance(Datify.parse('31.12.2021'), Datify)
+            Datify.parse_many(['31.12.2021'])
+
+        setup_variables.assert_not_called()
+
+
+class ValidationTestCase(unittest.TestCase):
+    dates = ['31.12.2021', '31.02.2022', '29.02.2024', '29.02.2023', '29.02.2000', '29.02.1900', '10 of Jan', 'text']
+    statuses = [DateStatus.VALID, DateStatus.INVALID_DAY, DateStatus.VALID, DateStatus.INVALID_DAY, DateStatus.VALID,
+                DateStatus.INVALID_DAY, DateStatus.INCOMPLETE, DateStatus.INCOMPLETE]
+
+    def test_validate_many(self):
+        results = Datify.parse_many(self.dates)
+
+        self.assertEqual(self.statuses, validate_many(results))
+        self.assertEqual(self.statuses, [result.status for result in results])
+
+        # the valid dates are exactly the dates the datetime can be created for
+        for result, status in zip(results, self.statuses):
+            if status == DateStatus.VALID:
+                self.assertIsNotNone(result.date())
+            elif status == DateStatus.INVALID_DAY:
+                self.assertRaises(ValueError, result.date)
+
+    def test_validate(self):
+        self.assertEqual(DateStatus.INVALID_YEAR, validate((0, 1, 1)))
+        self.assertEqual(DateStatus.INVALID_YEAR, validate((10000, 1, 1)))
+        self.assertEqual(DateStatus.INVALID_MONTH, validate((2020, 13, 1)))
+        self.assertEqual(DateStatus.INVALID_DAY, validate((2020, 4, 31)))
+        self.assertEqual(DateStatus.INVALID_DAY, validate((2020, 4, 0)))
+        self.assertEqual(DateStatus.INCOMPLETE, validate((2020, None, 1)))
+        self.assertEqual(DateStatus.VALID, validate((2020, 4, 30)))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_arrays_status(self):
+        arrays = Datify.parse_arrays(self.dates)
+
+        self.assertEqual(list(map(int, self.statuses)), arrays.status().tolist())
+        self.assertEqual([DateStatus.INVALID_MONTH], Datify.parse_arrays(['10 of Jan'], 2020, 13).status().tolist())
+        self.assertEqual([DateStatus.INVALID_YEAR], Datify.parse_arrays(['10 of Jan'], 10000).status().tolist())
+
+
+class ConversionTestCase(unittest.TestCase):
+    dates = [(1970, 1, 1), (1, 1, 1), (9999, 12, 31), (2024, 2, 29), (1969, 12, 31), (2023, 2, 29), (2021, None, 1)]
+
+    def test_conversions(self):
+        valid = [datetime(*date) for date in self.dates[:5]]
+
+        self.assertEqual([date.toordinal() for date in valid] + [None, None], to_ordinals(self.dates))
+        self.assertEqual([date.toordinal() - 719163 for date in valid] + [None, None], to_epoch_days(self.dates))
+        self.assertEqual([19700101, 10101, 99991231, 20240229, 19691231, None, None], to_yyyymmdd(self.dates))
+
+    def test_random_dates(self):
+        for _ in range(1000):
+            date = datetime.fromordinal(randint(1, 3652059))
+            self.assertEqual([date.toordinal()], to_ordinals([(date.year, date.month, date.day)]))
+
+    def test_iso(self):
+        self.assertEqual(['1970-01-01', '0001-01-01', '9999-12-31', '2024-02-29', '1969-12-31', '', ''],
+                         to_iso(self.dates))
+        self.assertEqual(['19700101', '00010101', '99991231', '20240229', '19691231', '-', '-'],
+                         to_iso(self.dates, separator='', empty='-'))
+        self.assertEqual(['2021/12/31', '', '', ''],
+                         to_iso(Datify.parse_many(['31.12.2021', '31.04.2021', '10 of Jan', 'text']), separator='/'))
+
+    @unittest.skipIf(np is None, 'NumPy is not installed')
+    def test_arrays(self):
+        arrays = Datify.parse_arrays(['1.1.1970', '31.12.2099', '29.02.2023', '10 of Jan', '1.3.1600'])
+
+        self.assertEqual([0, 47481, -1, -1, -135080], arrays.epoch_days(fill=-1).tolist())
+        self.assertEqual([719163, 766644, 0, 0, 584083], arrays.ordinals().tolist())
+        self.assertEqual([19700101, 20991231, 0, 0, 16000301], arrays.yyyymmdd().tolist())
+        self.assertEqual(to_epoch_days(Datify.parse_many(['1.3.1600'])), arrays.epoch_days()[-1:].tolist())
+        self.assertTrue(np.isnat(arrays.epoch_days().view('datetime64[D]')[2:4]).all())
+
+
+class ResultsCacheTestCase(unittest.TestCase):
+    def tearDown(self):
+        DatifyConfig.disable_cache()
+
+    def test_cache_is_opt_in(self):
+        self.assertIsNone(DatifyConfig.cache_info())
+        self.assertIsNone(DatifyConfig.parser().cache)
+
+    def test_repeated_strings(self):
+        DatifyConfig.enable_cache(maxsize=2)
+
+        for date in ('31.12.2021', '10 of Jan', '31.12.2021', '31.12.2021'):
+            self.assertEqual(Parser().parse(date).tuple(), Datify.parse(date).tuple())
+
+        self.assertEqual((2, 2, 2, 2), tuple(DatifyConfig.cache_info()))
+
+        # the least recently used result is evicted
+        Datify.parse_many(['20.01.2022', '10 of Jan'])
+        self.assertEqual((2, 4, 2, 2), tuple(DatifyConfig.cache_info()))
+
+        DatifyConfig.clear_cache()
+        self.assertEqual((0, 0, 2, 0), tuple(DatifyConfig.cache_info()))
+
+    def test_config_change_invalidates_results(self):
+        DatifyConfig.enable_cache()
+        self.assertEqual((2, 1, 2022), Datify.parse('2.1.2022').tuple())
+
+        DatifyConfig.day_first = False
+        try:
+            self.assertEqual((1, 2, 2022), Datify.parse('2.1.2022').tuple())
+        finally:
+            DatifyConfig.day_first = True
+
+        self.assertEqual((2, 1, 2022), Datify.parse('2.1.2022').tuple())
+        self.assertEqual(0, DatifyConfig.cache_info().hits)
+
+        # the results of the previous configuration versions do not take the space of the cache
+        self.assertEqual(1, DatifyConfig.cache_info().currsize)
+        self.assertEqual(4096, DatifyConfig.cache_info().maxsize)
+
+        self.assertRaises(ValueError, lambda: DatifyConfig.enable_cache(0))
+
+
+class ParseStreamTestCase(unittest.TestCase):
+    lines = ['31.12.2021', '14 лютого 2022', '', '10 of Jan', '2020-01-20']
+
+    def expected(self) -> list[tuple]:
+        return [tuple(reversed(Datify.parse(line).tuple())) for line in self.lines]
+
+    def test_text_stream(self):
+        stream = io.StringIO('\r\n'.join(self.lines) + '\n')
+
+        self.assertEqual(self.expected(), list(parse_stream(stream, chunk_size=4)))
+
+    def test_invalid_chunk_size(self):
+        for chunk_size in (0, -1):
+            self.assertRaises(ValueError, parse_stream, io.StringIO('1.1.2020\n'), chunk_size=chunk_size)
+
+    def test_binary_stream(self):
+        # the small chunks split the multibyte characters
+        stream = io.BytesIO('\n'.join(self.lines).encode('utf-8'))
+
+        self.assertEqual(self.expected(), list(parse_stream(stream, chunk_size=3)))
+
+    def test_iterable(self):
+        self.assertEqual(self.expected(), list(parse_stream(line + '\n' for line in self.lines)))
+        self.assertEqual([(2000, 1, 10)], list(parse_stream(['10 of Jan'], year=2000)))
+
+    def test_results(self):
+        result = next(parse_stream(['10 of Jan'], year=2000))
+
+        self.assertIsInstance(result, DatifyResult)
+        self.assertEqual((2000, 1, 10), (result.year, result.month, result.day))
+
+
+class FindAllTestCase(unittest.TestCase):
+    text = 'Signed on 11th of July, 2020 by the parties. Invoice 12 2021-12-31 paid.\n' \
+           'Delivered 14 лютого 2022 and 31.12.2021, 5 items cost 12.50 in March 2021; 20220101 next'
+
+    def test_dates_and_spans(self):
+        matches = list(find_all(self.text))
+
+        self.assertEqual(['11th of July, 2020', '2021-12-31', '14 лютого 2022', '31.12.2021', '20220101'],
+                         [self.text[m.start:m.end] for m in matches])
+        self.assertEqual([(2020, 7, 11), (2021, 12, 31), (2022, 2, 14), (2021, 12, 31), (2022, 1, 1)],
+                         [m.result for m in matches])
+        self.assertEqual((matches[0].start, matches[0].end), matches[0].span)
+
+    def test_partial_dates(self):
+        matches = list(find_all(self.text, partial=True))
+
+        self.assertEqual('March 2021', self.text[matches[-2].start:matches[-2].end])
+        self.assertEqual((2021, 3, None), matches[-2].result)
+        self.assertEqual(len(list(find_all(self.text))) + 1, len(matches))
+
+    def test_dates_are_parsed_like_strings(self):
+        parser = Parser(day_first=False)
+        text = 'from 12.31.2021 to July 5, 2022'
+
+        self.assertEqual([parser.parse('12.31.2021'), parser.parse('July 5, 2022')],
+                         [m.result for m in parser.find_all(text)])
+        self.assertEqual([], list(find_all('no dates here: 5 apples, 2021 pears')))
+
+    def test_numbers_before_dates(self):
+        texts = {
+            'Invoice 2019 due 12.11.2021': '12.11.2021',
+            'Order 1999 on 12/11/2021 shipped': '12/11/2021',
+            'call 555-1234 on 12/11/2021 or 1/2': '12/11/2021',
+            'Invoice 2019 12.11.2021': '12.11.2021',
+            'Order 1999 12 November 2021': '12 November 2021',
+            'from 31.12.2021, 5 items': '31.12.2021',
+        }
+
+        for text, date in texts.items():
+            self.assertEqual([date], [text[m.start:m.end] for m in find_all(text)], msg=text)
+            self.assertEqual([Datify.parse_many([date])[0]], [m.result for m in find_all(text)], msg=text)
+
+
+class ProfilingTestCase(unittest.TestCase):
+    def tearDown(self):
+        profiling.disable()
+
+    def test_stages(self):
+        parser = Parser()
+
+        with profiling.profile() as profile:
+            results = [parser.parse(s) for s in ('31.12.2021', '2022-02-23 10:00', '14 septembre 2022', '5 of Jan')]
+
+        self.assertIsNone(profiling.active())
+        self.assertEqual([Parser().parse(s) for s in ('31.12.2021', '2022-02-23 10:00', '14 septembre 2022', '5 of Jan')],
+                         results)
+
+        stats = profile.snapshot()
+        self.assertEqual(4, stats['parse']['calls'])
+        self.assertEqual(4, stats['numeric']['calls'])
+        self.assertEqual(3, stats['general_format']['calls'])
+        self.assertEqual(2, stats['split']['calls'])
+        self.assertEqual(2, stats['parts']['calls'])
+        # only 'septembre' is found with the fuzzy comparison, 'jan' is found exactly
+        self.assertEqual(1, stats['fuzzy_hits'])
+        self.assertGreater(stats['fuzzy_misses'], 0)
+        self.assertEqual(stats['month_fuzzy']['calls'], stats['fuzzy_hits'] + stats['fuzzy_misses'])
+        self.assertGreater(stats['parse']['time'], 0)
+
+    def test_switch(self):
+        self.assertIsNone(profiling.snapshot())
+
+        profile = profiling.enable()
+        Datify.parse('1 лютого')
+        self.assertIs(profile, profiling.active())
+        self.assertEqual(1, profiling.snapshot()['parse']['calls'])
+
+        profile.reset()
+        self.assertEqual(0, profile.snapshot()['parse']['calls'])
+
+        self.assertIs(profile, profiling.disable())
+        Datify.parse('2 лютого')
+        self.assertEqual(0, profile.snapshot()['parse']['calls'])
+
+
 def _random_date(is_alphanumeric: bool = False) -> tuple[str, Datify]:
     sep: str = _choose_from_set(DatifyConfig.splitters)
     day = randint(1, 31)
@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from datify import Datify, DatifyConfig
+
+try:
+    import numpy as np
+    import pandas as pd
+
+    import datify.pandas
+except ImportError:
+    pd = None
+
+
+@unittest.skipIf(pd is None, 'pandas is not installed')
+class PandasTestCase(unittest.TestCase):
+    values = ['31.12.2021', '10 of Jan', None, '31.02.2022', '31.12.2021', float('nan'), 'some text', '10 of Jan']
+
+    def series(self) -> pd.Series:
+        return pd.Series(self.values, index=list('abcdefgh'), name='created')
+
+    def test_parse_series(self):
+        parts = datify.pandas.parse_series(self.series())
+
+        self.assertEqual(['year', 'month', 'day'], list(parts.columns))
+        self.assertEqual(['Int32', 'Int16', 'Int16'], list(map(str, parts.dtypes)))
+        self.assertEqual(list('abcdefgh'), list(parts.index))
+
+        for value, row in zip(self.values, parts.itertuples(index=False)):
+            expected = tuple(reversed(Datify.parse(value).tuple())) if isinstance(value, str) else (None,) * 3
+            self.assertEqual(expected, tuple(None if part is pd.NA else part for part in row))
+
+    def test_distinct_values_are_parsed_once(self):
+        parser = DatifyConfig.parser()
+        with mock.patch.object(type(parser), 'parse_string', autospec=True,
+                               side_effect=type(parser).parse_string) as parse_string:
+            datify.pandas.parse_series(pd.concat([self.series()] * 100))
+
+        self.assertEqual(len({value for value in self.values if isinstance(value, str)}), parse_string.call_count)
+
+    def test_to_datetime(self):
+        dates = self.series().datify.to_datetime()
+
+        self.assertEqual('created', dates.name)
+        self.assertEqual(np.dtype('datetime64[s]'), dates.dtype)
+        self.assertEqual([pd.Timestamp('2021-12-31'), pd.Timestamp('2021-12-31')], dates.dropna().tolist())
+        self.assertEqual(['a', 'e'], list(dates.dropna().index))
+
+    def test_to_datetime_out_of_nanoseconds_range(self):
+        dates = pd.Series(['1.1.1500', '31.12.2999', 'May 5 2500']).datify.to_datetime()
+
+        self.assertEqual([pd.Timestamp('1500-01-01'), pd.Timestamp('2999-12-31'), pd.Timestamp('2500-05-05')],
+                         dates.tolist())
+
+    def test_accessor_predefined_parts(self):
+        parts = self.series().astype('category').datify.parse(year=2000)
+
+        self.assertEqual(2000, parts.loc['b', 'year'])
+        self.assertIs(pd.NA, parts.loc['c', 'year'])
+        self.assertEqual(pd.Timestamp('2000-01-10'), self.series().datify.to_datetime(year=2000)['b'])
+
+
+if __name__ == '__main__':
+    unittest.main()